@@ -1,5 +1,5 @@
 import threading
-from typing import Dict
+from typing import Dict, Mapping
 
 import gi
 gi.require_version("GLib", "2.0")
@@ -10,13 +10,18 @@ from nerdicon_browser.models import (
     resolve_font_file_for_family,
     read_glyph_names_from_font,
     IconItem,
+    CompactNameMap,
+    GlyphNameCache,
+    DEFAULT_CACHE_BUDGET,
 )
 
+_EMPTY_NAMES = CompactNameMap()
+
 
 class BrowserController:
-    def __init__(self, view):
+    def __init__(self, view, cache_budget_bytes: int = DEFAULT_CACHE_BUDGET):
         self.view = view
-        self._names_cache: Dict[str, Dict[int, str]] = {}
+        self._names_cache = GlyphNameCache(cache_budget_bytes)
 
         # Bind view event handlers
         self.view.bind_handlers(
@@ -44,6 +49,9 @@ class BrowserController:
         text = item.char()
         self.view.copy_to_clipboard(text, f"Copied {item.name} {item.code_hex()}")
 
+    def cache_stats(self) -> Dict[str, int]:
+        return self._names_cache.stats()
+
     def rebuild_from_font(self):
         current_font = self.view.get_selected_font()
         if not current_font:
@@ -54,23 +62,21 @@ class BrowserController:
 
         # Load names in a background thread (safe), then start scanning in main loop
         def load_names_then_scan():
+            def load_names() -> Dict[int, str]:
+                path = resolve_font_file_for_family(current_font)
+                return read_glyph_names_from_font(path) if path else {}
+
+            names_map: Mapping[int, str]
             try:
-                names_map: Dict[int, str] = {}
-                if current_font in self._names_cache:
-                    names_map = self._names_cache[current_font]
-                else:
-                    path = resolve_font_file_for_family(current_font)
-                    if path:
-                        names_map = read_glyph_names_from_font(path)
-                    self._names_cache[current_font] = names_map
+                names_map = self._names_cache.get_or_load(current_font, load_names)
             except Exception:
-                names_map = {}
+                names_map = _EMPTY_NAMES
 
             def start_scan_main():
                 # If user switched fonts, abort
                 if gen != self.view.get_generation():
                     return False
-                self.view.set_name_mapping(names_map or {})
+                self.view.set_name_mapping(names_map)
 
                 # Build Pango objects on main thread only
                 try:
@@ -4,10 +4,18 @@ from .font_utils import (
     resolve_font_file_for_family,
     read_glyph_names_from_font,
 )
+from .name_cache import (
+    CompactNameMap,
+    GlyphNameCache,
+    DEFAULT_CACHE_BUDGET,
+)
 
 __all__ = [
     "IconItem",
     "candidate_font_families",
     "resolve_font_file_for_family",
     "read_glyph_names_from_font",
+    "CompactNameMap",
+    "GlyphNameCache",
+    "DEFAULT_CACHE_BUDGET",
 ]
@@ -0,0 +1,142 @@
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterator, Optional
+
+# Default byte budget for all cached fonts combined
+DEFAULT_CACHE_BUDGET = 4 * 1024 * 1024
+
+
+class CompactNameMap(Mapping[int, str]):
+    """Read-only codepoint -> glyph name map stored in flat arrays.
+
+    Codepoints are kept sorted in an unsigned int array; names are packed
+    into a single UTF-8 blob addressed by an offsets array. Lookups bisect
+    the codepoint array and decode only the requested name.
+    """
+
+    __slots__ = ("_cps", "_offsets", "_blob")
+
+    def __init__(self, mapping: Optional[Mapping[int, str]] = None):
+        cps = array("I")
+        offsets = array("I", [0])
+        parts = []
+        pos = 0
+        for cp in sorted(mapping or {}):
+            encoded = str(mapping[cp]).encode("utf-8")
+            cps.append(int(cp))
+            parts.append(encoded)
+            pos += len(encoded)
+            offsets.append(pos)
+        self._cps = cps
+        self._offsets = offsets
+        self._blob = b"".join(parts)
+
+    def __len__(self) -> int:
+        return len(self._cps)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._cps)
+
+    def __contains__(self, cp: object) -> bool:
+        return self._index(cp) >= 0
+
+    def __getitem__(self, cp: int) -> str:
+        i = self._index(cp)
+        if i < 0:
+            raise KeyError(cp)
+        return self._blob[self._offsets[i]:self._offsets[i + 1]].decode("utf-8")
+
+    def _index(self, cp: object) -> int:
+        if not isinstance(cp, int):
+            return -1
+        i = bisect_left(self._cps, cp)
+        if i < len(self._cps) and self._cps[i] == cp:
+            return i
+        return -1
+
+    def nbytes(self) -> int:
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self._cps)
+            + sys.getsizeof(self._offsets)
+            + sys.getsizeof(self._blob)
+        )
+
+
+class GlyphNameCache:
+    """Thread-safe LRU cache of CompactNameMap per font family.
+
+    Entries are accounted by their measured size and the least recently
+    used fonts are evicted once the total exceeds ``budget_bytes``. The
+    most recently stored font is always kept, even if it alone is over
+    budget, so the current font never has to be reloaded.
+    """
+
+    def __init__(self, budget_bytes: int = DEFAULT_CACHE_BUDGET):
+        self.budget_bytes = max(0, int(budget_bytes))
+        self._entries: "OrderedDict[str, CompactNameMap]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._total = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, family: str) -> Optional[CompactNameMap]:
+        with self._lock:
+            entry = self._entries.get(family)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(family)
+            self._hits += 1
+            return entry
+
+    def put(self, family: str, mapping: Mapping[int, str]) -> CompactNameMap:
+        entry = mapping if isinstance(mapping, CompactNameMap) else CompactNameMap(mapping)
+        size = entry.nbytes()
+        with self._lock:
+            if family in self._entries:
+                self._total -= self._sizes.pop(family)
+                del self._entries[family]
+            self._entries[family] = entry
+            self._sizes[family] = size
+            self._total += size
+            self._evict_locked()
+        return entry
+
+    def get_or_load(self, family: str, loader: Callable[[], Mapping[int, str]]) -> CompactNameMap:
+        entry = self.get(family)
+        if entry is not None:
+            return entry
+        return self.put(family, loader())
+
+    def set_budget(self, budget_bytes: int):
+        with self._lock:
+            self.budget_bytes = max(0, int(budget_bytes))
+            self._evict_locked()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total,
+                "budget_bytes": self.budget_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _evict_locked(self):
+        while self._total > self.budget_bytes and len(self._entries) > 1:
+            family, _ = self._entries.popitem(last=False)
+            self._total -= self._sizes.pop(family)
+            self._evictions += 1
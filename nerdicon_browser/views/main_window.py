@@ -1,5 +1,5 @@
 import os
-from typing import Callable, Optional
+from typing import Callable, Mapping, Optional
 
 import gi
 gi.require_version("Gtk", "4.0")
@@ -136,7 +136,7 @@ class IconBrowserWindow(Adw.ApplicationWindow):
         except Exception:
             pass
 
-    def set_name_mapping(self, mapping: dict[int, str]):
+    def set_name_mapping(self, mapping: Mapping[int, str]):
         self.name_by_cp = mapping or {}
 
     def clear_items(self):
@@ -0,0 +1,107 @@
+import sys
+
+import pytest
+
+from nerdicon_browser.models.name_cache import CompactNameMap, GlyphNameCache
+
+
+def _font_names(count: int = 8000, prefix: str = "nf-md-icon") -> dict[int, str]:
+    return {0xF0000 + i: f"{prefix}_{i}" for i in range(count)}
+
+
+def test_compact_map_lookups():
+    names = _font_names(100)
+    compact = CompactNameMap(names)
+
+    assert len(compact) == 100
+    assert compact[0xF0005] == "nf-md-icon_5"
+    assert compact.get(0xF0005) == "nf-md-icon_5"
+    assert 0xF0005 in compact
+    assert dict(compact) == names
+
+    assert compact.get(0xE000) is None
+    assert compact.get(0xE000, "fallback") == "fallback"
+    assert 0xE000 not in compact
+    with pytest.raises(KeyError):
+        compact[0xE000]
+
+
+def test_compact_map_empty_is_falsy():
+    assert not CompactNameMap()
+    assert not CompactNameMap({})
+    assert len(CompactNameMap()) == 0
+
+
+def test_compact_map_smaller_than_dict():
+    names = _font_names()
+    compact = CompactNameMap(names)
+    dict_bytes = sys.getsizeof(names) + sum(sys.getsizeof(v) for v in names.values())
+    assert compact.nbytes() < dict_bytes / 2
+
+
+def test_lru_eviction_respects_recency():
+    size = CompactNameMap(_font_names()).nbytes()
+    cache = GlyphNameCache(2 * size)
+    cache.put("a", _font_names())
+    cache.put("b", _font_names())
+
+    # Touch "a" so "b" becomes least recently used
+    assert cache.get("a") is not None
+    cache.put("c", _font_names())
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats()["bytes"] == 2 * size
+
+
+def test_single_entry_over_budget_is_kept():
+    cache = GlyphNameCache(16)
+    entry = cache.put("big", _font_names())
+    assert cache.get("big") is entry
+    assert len(cache) == 1
+
+    cache.put("other", _font_names(10))
+    assert len(cache) == 1
+    assert cache.get("big") is None
+    assert cache.get("other") is not None
+
+
+def test_set_budget_shrinks_cache():
+    size = CompactNameMap(_font_names()).nbytes()
+    cache = GlyphNameCache(3 * size)
+    for family in ("a", "b", "c"):
+        cache.put(family, _font_names())
+    assert len(cache) == 3
+
+    cache.set_budget(size)
+    stats = cache.stats()
+    assert stats["entries"] == 1
+    assert stats["bytes"] == size
+    assert stats["budget_bytes"] == size
+    assert stats["evictions"] == 2
+    assert cache.get("c") is not None
+
+
+def test_stats_counters():
+    size = CompactNameMap(_font_names()).nbytes()
+    cache = GlyphNameCache(2 * size)
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return _font_names()
+
+    for family in ("a", "b", "c"):
+        cache.get_or_load(family, loader)
+    cache.get_or_load("c", loader)
+
+    assert len(loads) == 3
+    assert cache.stats() == {
+        "entries": 2,
+        "bytes": 2 * size,
+        "budget_bytes": 2 * size,
+        "hits": 1,
+        "misses": 3,
+        "evictions": 1,
+    }